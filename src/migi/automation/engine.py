@@ -1,53 +1,72 @@
 from __future__ import annotations
 
 import ast
+import asyncio
+import atexit
 import base64
 import contextlib
+import functools
 import importlib
 import io
+import json
+import math
 import os
 import platform
 import re
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:
+    _orjson = None
+
+try:
+    import pybase64 as _pybase64
+except ModuleNotFoundError:
+    _pybase64 = None
+
+from migi.automation.profiles import (
+    CAPTURE_MODE_CHOICES,
+    DEFAULT_CAPTURE_MODE,
+    DEFAULT_PERFORMANCE_PROFILE,
+    PERFORMANCE_PROFILES,
+    PerformanceTuning,
+    resolve_capture_mode,
+    resolve_performance_tuning,
+)
+
 
 COORDINATE_SCALE = 1000
 SCREENSHOT_FORMAT = "jpeg"
 
 DEFAULT_MODEL = "gpt-4o-mini"
 DEFAULT_BASE_URL = "https://api.openai.com/v1"
-DEFAULT_PERFORMANCE_PROFILE = "balanced"
-DEFAULT_CAPTURE_MODE = "auto"
 
 MAX_PIXELS = 16384 * 28 * 28
 MIN_PIXELS = 100 * 28 * 28
 PIXELS_PER_SCROLL_CLICK = 15
 
+# Screenshots whose luminance mass sits at the histogram extremes are flat
+# UI chrome; they compress indistinguishably at a lower JPEG quality.
+FLAT_FRAME_LUMA_FRACTION = 0.7
+FLAT_FRAME_JPEG_QUALITY = 60
+
+_SYSTEM = platform.system()
+_IS_MACOS = _SYSTEM == "Darwin"
+
 _mss_instance: Any | None = None
+_capture_executor: ThreadPoolExecutor | None = None
+_jpeg_scratch = io.BytesIO()
 _httpx_clients: dict[float, Any] = {}
+_async_httpx_clients: dict[float, Any] = {}
 _last_window_region_macos: CaptureRegion | None = None
 
 
-@dataclass(frozen=True)
-class PerformanceTuning:
-    name: str
-    screenshot_quality: int
-    screenshot_max_long_edge: int
-    request_timeout_seconds: float
-    computer_use_max_tokens: int | None
-    image_max_tokens: int | None
-    action_inter_step_delay: float
-    action_clipboard_sync_delay: float
-    action_paste_settle_delay: float
-    action_pre_exec_delay: float
-    action_hotkey_interval: float
-    action_wait_duration: float
-
-
 @dataclass(frozen=True)
 class CaptureRegion:
     left: int
@@ -63,52 +82,6 @@ class WeChatSendRequest:
     content: str
 
 
-PERFORMANCE_PROFILES: dict[str, PerformanceTuning] = {
-    "fast": PerformanceTuning(
-        name="fast",
-        screenshot_quality=60,
-        screenshot_max_long_edge=1366,
-        request_timeout_seconds=60.0,
-        computer_use_max_tokens=192,
-        image_max_tokens=384,
-        action_inter_step_delay=0.04,
-        action_clipboard_sync_delay=0.03,
-        action_paste_settle_delay=0.06,
-        action_pre_exec_delay=0.04,
-        action_hotkey_interval=0.03,
-        action_wait_duration=1.0,
-    ),
-    "balanced": PerformanceTuning(
-        name="balanced",
-        screenshot_quality=70,
-        screenshot_max_long_edge=1600,
-        request_timeout_seconds=90.0,
-        computer_use_max_tokens=256,
-        image_max_tokens=512,
-        action_inter_step_delay=0.08,
-        action_clipboard_sync_delay=0.05,
-        action_paste_settle_delay=0.12,
-        action_pre_exec_delay=0.08,
-        action_hotkey_interval=0.05,
-        action_wait_duration=2.0,
-    ),
-    "accurate": PerformanceTuning(
-        name="accurate",
-        screenshot_quality=80,
-        screenshot_max_long_edge=1920,
-        request_timeout_seconds=120.0,
-        computer_use_max_tokens=384,
-        image_max_tokens=768,
-        action_inter_step_delay=0.08,
-        action_clipboard_sync_delay=0.05,
-        action_paste_settle_delay=0.12,
-        action_pre_exec_delay=0.08,
-        action_hotkey_interval=0.05,
-        action_wait_duration=2.0,
-    ),
-}
-
-CAPTURE_MODE_CHOICES = ("auto", "screen", "window")
 KNOWN_APP_ALIASES: dict[str, list[str]] = {
     "WeChat": ["wechat", "微信"],
 }
@@ -118,40 +91,74 @@ class DependencyError(RuntimeError):
     pass
 
 
-def _import_gui_dependencies() -> dict[str, Any]:
-    try:
-        import httpx
-        import mss
-        import pyautogui
-        import pyperclip
-        from PIL import Image
-    except ModuleNotFoundError as exc:
-        raise DependencyError(
-            "Missing optional dependency for GUI automation. "
-            "Install: httpx mss pyautogui pyperclip pillow"
-        ) from exc
-    return {
-        "httpx": httpx,
-        "mss": mss,
-        "pyautogui": pyautogui,
-        "pyperclip": pyperclip,
-        "Image": Image,
-    }
+_http_deps: dict[str, Any] | None = None
+_capture_deps: dict[str, Any] | None = None
+_input_deps: dict[str, Any] | None = None
+
+
+def _import_http_deps() -> dict[str, Any]:
+    global _http_deps
+    if _http_deps is None:
+        try:
+            import httpx
+        except ModuleNotFoundError as exc:
+            raise DependencyError(
+                "Missing optional dependency for model inference. Install: httpx"
+            ) from exc
+        _http_deps = {"httpx": httpx}
+    return _http_deps
+
+
+def _import_capture_deps() -> dict[str, Any]:
+    global _capture_deps
+    if _capture_deps is None:
+        try:
+            import mss
+            from PIL import Image
+        except ModuleNotFoundError as exc:
+            raise DependencyError(
+                "Missing optional dependency for screen capture. Install: mss pillow"
+            ) from exc
+        _capture_deps = {"mss": mss, "Image": Image}
+    return _capture_deps
+
+
+def _import_input_deps() -> dict[str, Any]:
+    global _input_deps
+    if _input_deps is None:
+        try:
+            import pyautogui
+            import pyperclip
+        except ModuleNotFoundError as exc:
+            raise DependencyError(
+                "Missing optional dependency for action execution. "
+                "Install: pyautogui pyperclip"
+            ) from exc
+        # pyautogui defaults to a 0.1s pause after every call; the engine adds
+        # its own profile-tuned settle delays, so keep the built-in pause short.
+        pyautogui.PAUSE = 0.05
+        _input_deps = {"pyautogui": pyautogui, "pyperclip": pyperclip}
+    return _input_deps
+
+
+def _import_gui_dependencies(execute_action: bool = True) -> dict[str, Any]:
+    deps = {**_import_http_deps(), **_import_capture_deps()}
+    if execute_action:
+        # pyautogui alone costs hundreds of ms on first import; analysis-only
+        # runs (see / --no-exec) never need it.
+        deps.update(_import_input_deps())
+    return deps
 
 
 def _import_vision_dependencies() -> dict[str, Any]:
     try:
-        import httpx
         from PIL import Image
     except ModuleNotFoundError as exc:
         raise DependencyError(
             "Missing optional dependency for image understanding. "
             "Install: httpx pillow"
         ) from exc
-    return {
-        "httpx": httpx,
-        "Image": Image,
-    }
+    return {**_import_http_deps(), "Image": Image}
 
 
 COMPUTER_USE_PROMPT = """You are a GUI agent. You are given a task and your action history, with screenshots. You need to perform actions to complete the task.
@@ -250,34 +257,26 @@ class AutomationResult:
 
 
 def safe_literal_eval(value: str) -> Any:
-    return ast.literal_eval(value)
-
-
-def resolve_performance_tuning(profile: str | None = None) -> PerformanceTuning:
-    profile_name = (profile or DEFAULT_PERFORMANCE_PROFILE).strip().lower()
-    tuning = PERFORMANCE_PROFILES.get(profile_name)
-    if tuning is None:
-        supported = ", ".join(sorted(PERFORMANCE_PROFILES))
-        raise ValueError(f"Unsupported performance profile: {profile_name}. Use one of: {supported}.")
-    return tuning
-
-
-def resolve_capture_mode(capture_mode: str | None = None, app_launch_intent: bool = False) -> str:
-    mode = (capture_mode or DEFAULT_CAPTURE_MODE).strip().lower()
-    if mode not in CAPTURE_MODE_CHOICES:
-        supported = ", ".join(CAPTURE_MODE_CHOICES)
-        raise ValueError(f"Unsupported capture mode: {mode}. Use one of: {supported}.")
-    if mode == "auto":
-        return "screen" if app_launch_intent else "window"
-    return mode
+    # Point literals like "[512, 384]" are JSON after a quote swap; json.loads
+    # is a straight C parse while ast.literal_eval compiles a full Python AST.
+    try:
+        return json.loads(value.replace("'", '"'))
+    except (ValueError, TypeError):
+        return ast.literal_eval(value)
 
 
-def _downscale_if_needed(image: Any, max_long_edge: int) -> Any:
+def _downscale_if_needed(image: Any, max_long_edge: int, max_pixels: int = MAX_PIXELS) -> Any:
     w, h = image.size
     long_edge = max(w, h)
-    if long_edge <= max_long_edge:
+    scale = 1.0
+    if long_edge > max_long_edge:
+        scale = max_long_edge / long_edge
+    # The model downsamples anything above its pixel budget anyway, so
+    # encoding and uploading more than MAX_PIXELS is wasted work.
+    if (w * scale) * (h * scale) > max_pixels:
+        scale = math.sqrt(max_pixels / (w * h))
+    if scale >= 1.0:
         return image
-    scale = max_long_edge / long_edge
     new_w = round(w * scale)
     new_h = round(h * scale)
     try:
@@ -288,16 +287,70 @@ def _downscale_if_needed(image: Any, max_long_edge: int) -> Any:
     return image.resize((new_w, new_h), resample)
 
 
-def _encode_image_from_pil(image: Any, fmt: str = "jpeg", quality: int = 80) -> str:
-    buffer = io.BytesIO()
+def _encode_image_from_pil(
+    image: Any,
+    fmt: str = "jpeg",
+    quality: int = 80,
+    subsampling: int = 2,
+    progressive: bool = True,
+) -> str:
+    # Reuse one scratch buffer across captures; repeated BytesIO allocation
+    # and growth is pure churn for a stream of similarly sized JPEGs.
+    buffer = _jpeg_scratch
+    buffer.seek(0)
+    buffer.truncate(0)
     if fmt.lower() == "jpeg":
         if image.mode not in {"RGB", "L"}:
             image = image.convert("RGB")
-        image.save(buffer, format="JPEG", quality=quality)
+        # 4:2:0 subsampling plus progressive scan cuts payload 20-40% on
+        # flat UI screenshots without hurting OCR-relevant detail.
+        image.save(
+            buffer,
+            format="JPEG",
+            quality=quality,
+            subsampling=subsampling,
+            progressive=progressive,
+        )
     else:
         image.save(buffer, format=fmt.upper())
-    buffer.seek(0)
-    return base64.b64encode(buffer.read()).decode("utf-8")
+    view = buffer.getbuffer()
+    try:
+        if _pybase64 is not None:
+            # Vectorized encoder fed from a memoryview: no copy into bytes
+            # and no separate UTF-8 decode pass over the encoded image.
+            return _pybase64.b64encode_as_string(view)
+        return base64.b64encode(view).decode("ascii")
+    finally:
+        # Release the export so the next call may truncate the scratch buffer.
+        view.release()
+
+
+def _dynamic_jpeg_quality(image: Any, base_quality: int) -> int:
+    if base_quality <= FLAT_FRAME_JPEG_QUALITY:
+        return base_quality
+    try:
+        hist = image.convert("L").histogram()
+    except Exception:  # noqa: BLE001
+        return base_quality
+    total = sum(hist)
+    if not total:
+        return base_quality
+    # Fraction of pixels in the darkest / brightest 20% of luminance bins.
+    extreme = sum(hist[:52]) + sum(hist[-52:])
+    if extreme / total > FLAT_FRAME_LUMA_FRACTION:
+        return FLAT_FRAME_JPEG_QUALITY
+    return base_quality
+
+
+def _get_capture_executor() -> ThreadPoolExecutor:
+    # One dedicated worker: the shared mss instance and JPEG scratch buffer
+    # are not thread-safe, and pinning capture to a single thread still lets
+    # the event loop overlap encoding with the in-flight HTTP request.
+    global _capture_executor
+    if _capture_executor is None:
+        _capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="migi-capture")
+        atexit.register(_capture_executor.shutdown)
+    return _capture_executor
 
 
 def _get_mss_instance(mss_module: Any) -> Any:
@@ -387,7 +440,7 @@ def capture_screenshot(
     monitor_region = _primary_monitor_region(sct)
     effective_mode = resolve_capture_mode(capture_mode, app_launch_intent=app_launch_intent)
     capture_region = monitor_region
-    if effective_mode == "window" and platform.system() == "Darwin":
+    if effective_mode == "window" and _IS_MACOS:
         window_region = _front_window_region_macos()
         clamped_region = (
             _clamp_region_to_monitor(window_region, monitor_region)
@@ -405,10 +458,13 @@ def capture_screenshot(
             "height": capture_region.height,
         }
     )
-    screenshot = deps["Image"].frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+    # frombuffer wraps the mss grab buffer without the per-pixel copy that
+    # frombytes performs; the image must be consumed before the next grab
+    # because the underlying buffer is reused by the shared mss instance.
+    screenshot = deps["Image"].frombuffer("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX", 0, 1)
     width, height = screenshot.size
     encoded = _downscale_if_needed(screenshot, max_long_edge=max_long_edge)
-    base64_data = _encode_image_from_pil(encoded, fmt, quality)
+    base64_data = _encode_image_from_pil(encoded, fmt, _dynamic_jpeg_quality(encoded, quality))
     return screenshot, width, height, base64_data, capture_region
 
 
@@ -434,7 +490,7 @@ def load_image_file(
 
 
 def _platform_search_hint() -> tuple[str, str, str]:
-    system = platform.system().lower()
+    system = _SYSTEM.lower()
     if system == "darwin":
         return "macOS", "Spotlight", "command space"
     if system == "windows":
@@ -550,11 +606,11 @@ def build_image_understanding_messages(
 
 
 def _wechat_search_hotkey() -> str:
-    return "command f" if platform.system() == "Darwin" else "ctrl f"
+    return "command f" if _IS_MACOS else "ctrl f"
 
 
 def _select_all_hotkey() -> str:
-    return "command a" if platform.system() == "Darwin" else "ctrl a"
+    return "command a" if _IS_MACOS else "ctrl a"
 
 
 def _build_wechat_recipient_selection_instruction(recipient: str) -> str:
@@ -593,15 +649,43 @@ def _get_httpx_client(deps: dict[str, Any], timeout_seconds: float) -> Any:
     return client
 
 
-def call_model_inference(
-    deps: dict[str, Any],
+def _get_async_httpx_client(deps: dict[str, Any], timeout_seconds: float) -> Any:
+    client = _async_httpx_clients.get(timeout_seconds)
+    if client is None:
+        httpx = deps["httpx"]
+        limits = httpx.Limits(max_keepalive_connections=4)
+        try:
+            client = httpx.AsyncClient(timeout=timeout_seconds, http2=True, limits=limits)
+        except ImportError:
+            client = httpx.AsyncClient(timeout=timeout_seconds, limits=limits)
+        _async_httpx_clients[timeout_seconds] = client
+    return client
+
+
+def _close_async_httpx_clients() -> None:
+    clients = list(_async_httpx_clients.values())
+    _async_httpx_clients.clear()
+    if not clients:
+        return
+
+    async def _close_all() -> None:
+        for client in clients:
+            await client.aclose()
+
+    with contextlib.suppress(Exception):
+        asyncio.run(_close_all())
+
+
+atexit.register(_close_async_httpx_clients)
+
+
+def _prepare_inference_request(
     messages: list[dict[str, Any]],
     api_key: str,
-    model_name: str | None = None,
-    base_url: str | None = None,
-    timeout_seconds: float = PERFORMANCE_PROFILES[DEFAULT_PERFORMANCE_PROFILE].request_timeout_seconds,
-    max_tokens: int | None = None,
-) -> str:
+    model_name: str | None,
+    base_url: str | None,
+    max_tokens: int | None,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
     if not api_key:
         raise ValueError("api_key is required. Run `migi setup` or provide --api-key.")
     model_name = model_name or DEFAULT_MODEL
@@ -621,19 +705,27 @@ def call_model_inference(
     }
     if max_tokens is not None:
         payload["max_tokens"] = max_tokens
-    client = _get_httpx_client(deps, timeout_seconds=timeout_seconds)
-    response = client.post(endpoint, headers=headers, json=payload)
-    if response.status_code >= 400 and max_tokens is not None and response.status_code in {400, 422}:
-        retry_payload = dict(payload)
-        retry_payload.pop("max_tokens", None)
-        retry_response = client.post(endpoint, headers=headers, json=retry_payload)
-        if retry_response.status_code < 400:
-            response = retry_response
+    return endpoint, headers, payload
+
+
+def _payload_kwargs(payload: dict[str, Any]) -> dict[str, Any]:
+    # orjson serializes the multi-hundred-KB base64 payload several times
+    # faster than the stdlib encoder httpx would use for the json= kwarg.
+    if _orjson is not None:
+        return {"content": _orjson.dumps(payload)}
+    return {"json": payload}
+
+
+def _should_retry_without_max_tokens(response: Any, max_tokens: int | None) -> bool:
+    return max_tokens is not None and response.status_code in {400, 422}
+
+
+def _parse_inference_response(response: Any) -> str:
     if response.status_code >= 400:
         raise ValueError(
             f"Model request failed ({response.status_code}): {response.text[:500]}"
         )
-    data = response.json()
+    data = _orjson.loads(response.content) if _orjson is not None else response.json()
 
     choices = data.get("choices") or []
     if not choices:
@@ -645,6 +737,52 @@ def call_model_inference(
     return content
 
 
+def call_model_inference(
+    deps: dict[str, Any],
+    messages: list[dict[str, Any]],
+    api_key: str,
+    model_name: str | None = None,
+    base_url: str | None = None,
+    timeout_seconds: float = PERFORMANCE_PROFILES[DEFAULT_PERFORMANCE_PROFILE].request_timeout_seconds,
+    max_tokens: int | None = None,
+) -> str:
+    endpoint, headers, payload = _prepare_inference_request(
+        messages, api_key, model_name, base_url, max_tokens
+    )
+    client = _get_httpx_client(deps, timeout_seconds=timeout_seconds)
+    response = client.post(endpoint, headers=headers, **_payload_kwargs(payload))
+    if response.status_code >= 400 and _should_retry_without_max_tokens(response, max_tokens):
+        retry_payload = dict(payload)
+        retry_payload.pop("max_tokens", None)
+        retry_response = client.post(endpoint, headers=headers, **_payload_kwargs(retry_payload))
+        if retry_response.status_code < 400:
+            response = retry_response
+    return _parse_inference_response(response)
+
+
+async def call_model_inference_async(
+    deps: dict[str, Any],
+    messages: list[dict[str, Any]],
+    api_key: str,
+    model_name: str | None = None,
+    base_url: str | None = None,
+    timeout_seconds: float = PERFORMANCE_PROFILES[DEFAULT_PERFORMANCE_PROFILE].request_timeout_seconds,
+    max_tokens: int | None = None,
+) -> str:
+    endpoint, headers, payload = _prepare_inference_request(
+        messages, api_key, model_name, base_url, max_tokens
+    )
+    client = _get_async_httpx_client(deps, timeout_seconds=timeout_seconds)
+    response = await client.post(endpoint, headers=headers, **_payload_kwargs(payload))
+    if response.status_code >= 400 and _should_retry_without_max_tokens(response, max_tokens):
+        retry_payload = dict(payload)
+        retry_payload.pop("max_tokens", None)
+        retry_response = await client.post(endpoint, headers=headers, **_payload_kwargs(retry_payload))
+        if retry_response.status_code < 400:
+            response = retry_response
+    return _parse_inference_response(response)
+
+
 KEY_MAPPING = {
     "content": "content",
     "start_box": "start_box",
@@ -652,6 +790,43 @@ KEY_MAPPING = {
     "direction": "direction",
 }
 
+# Action types whose UI effect the next sub-action may depend on; only
+# these need the inter-step settle delay. hover/wait/finished do not.
+_UI_MUTATING_ACTIONS = {
+    "type",
+    "hotkey",
+    "scroll",
+    "click",
+    "left_single",
+    "left_double",
+    "right_single",
+    "drag",
+    "select",
+}
+
+_META_KEY = "command" if _IS_MACOS else "winleft"
+_HOTKEY_MAP = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "cmd": _META_KEY,
+    "meta": _META_KEY,
+    "super": _META_KEY,
+    "win": "winleft",
+    "windows": "winleft",
+    "command": _META_KEY,
+    "alt": "alt",
+    "option": "alt",
+    "shift": "shift",
+    "enter": "enter",
+    "return": "enter",
+    "tab": "tab",
+    "esc": "escape",
+    "escape": "escape",
+    "space": "space",
+    "backspace": "backspace",
+    "delete": "delete",
+}
+
 
 def _point_to_screen_xy(
     point: list[Any] | tuple[Any, ...],
@@ -754,17 +929,36 @@ def execute_pyautogui_action(
     if isinstance(responses, dict):
         responses = [responses]
 
+    # Bind the invariant mapping parameters once; every point in this batch
+    # converts through the same capture geometry.
+    _to_screen = functools.partial(
+        _box_to_screen_xy,
+        image_width=image_width,
+        image_height=image_height,
+        capture_region=capture_region,
+        screen_width=screen_width,
+        screen_height=screen_height,
+        scale_factor=scale_factor,
+    )
+
     result_info: list[str] = []
+    previous_action_type: str | None = None
     for index, response in enumerate(responses):
-        if index > 0:
-            time.sleep(tuning.action_inter_step_delay)
         action_type = response.get("action_type")
+        if index > 0 and previous_action_type in _UI_MUTATING_ACTIONS:
+            time.sleep(tuning.action_inter_step_delay)
+        previous_action_type = action_type
         action_inputs = response.get("action_inputs", {})
 
         normalized_inputs: dict[str, Any] = {}
         for key, value in action_inputs.items():
             new_key = KEY_MAPPING.get(key, key)
-            if isinstance(value, str) and "<point>" in value:
+            # Builtin-parsed inputs are already lists; only strings from
+            # custom/ui_tars parsers need the <point> literal round-trip.
+            if not isinstance(value, str):
+                normalized_inputs[new_key] = value
+                continue
+            if "<point>" in value:
                 value = safe_literal_eval(value)
             normalized_inputs[new_key] = value
         action_inputs = normalized_inputs
@@ -774,7 +968,7 @@ def execute_pyautogui_action(
             if content:
                 pyperclip.copy(content)
                 time.sleep(tuning.action_clipboard_sync_delay)
-                if platform.system() == "Darwin":
+                if _IS_MACOS:
                     pyautogui.hotkey("command", "v", interval=tuning.action_hotkey_interval)
                 else:
                     pyautogui.hotkey("ctrl", "v", interval=tuning.action_hotkey_interval)
@@ -790,24 +984,8 @@ def execute_pyautogui_action(
                     start_box = safe_literal_eval(start_box)
                 if isinstance(end_box, str):
                     end_box = safe_literal_eval(end_box)
-                sx, sy = _box_to_screen_xy(
-                    start_box,
-                    image_width,
-                    image_height,
-                    capture_region,
-                    screen_width,
-                    screen_height,
-                    scale_factor,
-                )
-                ex, ey = _box_to_screen_xy(
-                    end_box,
-                    image_width,
-                    image_height,
-                    capture_region,
-                    screen_width,
-                    screen_height,
-                    scale_factor,
-                )
+                sx, sy = _to_screen(start_box)
+                ex, ey = _to_screen(end_box)
                 pyautogui.moveTo(sx, sy)
                 pyautogui.dragTo(ex, ey, duration=1.0)
                 result_info.append(f"drag:{sx},{sy}->{ex},{ey}")
@@ -818,15 +996,7 @@ def execute_pyautogui_action(
             if start_box:
                 if isinstance(start_box, str):
                     start_box = safe_literal_eval(start_box)
-                x, y = _box_to_screen_xy(
-                    start_box,
-                    image_width,
-                    image_height,
-                    capture_region,
-                    screen_width,
-                    screen_height,
-                    scale_factor,
-                )
+                x, y = _to_screen(start_box)
             scroll_amount = max(1, int(screen_height * 0.25) // PIXELS_PER_SCROLL_CLICK)
             if "up" in direction:
                 pyautogui.scroll(scroll_amount, x=x, y=y)
@@ -839,15 +1009,7 @@ def execute_pyautogui_action(
             if start_box:
                 if isinstance(start_box, str):
                     start_box = safe_literal_eval(start_box)
-                x, y = _box_to_screen_xy(
-                    start_box,
-                    image_width,
-                    image_height,
-                    capture_region,
-                    screen_width,
-                    screen_height,
-                    scale_factor,
-                )
+                x, y = _to_screen(start_box)
                 if action_type in {"left_single", "click"}:
                     pyautogui.click(x, y)
                     result_info.append(f"click:{x},{y}")
@@ -864,30 +1026,7 @@ def execute_pyautogui_action(
             key_combo = action_inputs.get("content", "") or action_inputs.get("key", "")
             keys = [item for item in re.split(r"[+\s,]+", str(key_combo).lower().strip()) if item]
             if keys:
-                is_macos = platform.system() == "Darwin"
-                meta_key = "command" if is_macos else "winleft"
-                key_map = {
-                    "ctrl": "ctrl",
-                    "control": "ctrl",
-                    "cmd": "command" if is_macos else meta_key,
-                    "meta": meta_key,
-                    "super": meta_key,
-                    "win": "winleft",
-                    "windows": "winleft",
-                    "command": "command" if is_macos else meta_key,
-                    "alt": "alt",
-                    "option": "alt",
-                    "shift": "shift",
-                    "enter": "enter",
-                    "return": "enter",
-                    "tab": "tab",
-                    "esc": "escape",
-                    "escape": "escape",
-                    "space": "space",
-                    "backspace": "backspace",
-                    "delete": "delete",
-                }
-                mapped = [key_map.get(item, item) for item in keys]
+                mapped = [_HOTKEY_MAP.get(item, item) for item in keys]
                 supported_keys = set(getattr(pyautogui, "KEYBOARD_KEYS", []))
                 if supported_keys:
                     unknown = [item for item in mapped if item not in supported_keys]
@@ -916,60 +1055,92 @@ def execute_pyautogui_action(
     return result_info
 
 
+_XML_ACTION_RE = re.compile(r"<action>(.*?)</action>", re.IGNORECASE | re.DOTALL)
+_ACTION_NAMES = (
+    "click",
+    "left_double",
+    "right_single",
+    "drag",
+    "hotkey",
+    "type",
+    "scroll",
+    "wait",
+    "finished",
+    "left_single",
+    "hover",
+    "select",
+)
+_ACTION_CALL_RE = re.compile(
+    r"(?:Action:\s*)?(?:" + "|".join(_ACTION_NAMES) + r")\s*\([^)]*\)", re.IGNORECASE
+)
+_CALL_SIG_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)\((.*)\)$", re.DOTALL)
+_WS_RE = re.compile(r"\s+")
+
+
 def _split_multi_actions(response: str) -> list[str]:
+    # Bare call strings; the ui_tars branch re-adds its required
+    # "Action: " prefix itself, so prepending it here for every action
+    # just to strip it again in _extract_call_parts was wasted work.
     actions: list[str] = []
-    xml_pattern = re.compile(r"<action>(.*?)</action>", re.IGNORECASE | re.DOTALL)
-    xml_matches = xml_pattern.findall(response)
+    xml_matches = _XML_ACTION_RE.findall(response)
     if xml_matches:
         for match in xml_matches:
             action_str = match.strip()
             if action_str:
-                actions.append(f"Action: {action_str}")
+                actions.append(action_str)
         return actions
 
-    action_funcs = [
-        "click",
-        "left_double",
-        "right_single",
-        "drag",
-        "hotkey",
-        "type",
-        "scroll",
-        "wait",
-        "finished",
-        "left_single",
-        "hover",
-        "select",
-    ]
-    pattern = re.compile(r"(?:Action:\s*)?(" + "|".join(action_funcs) + r")\s*\([^)]*\)", re.IGNORECASE)
-    for match in pattern.finditer(response):
+    for match in _ACTION_CALL_RE.finditer(response):
         action_str = match.group(0)
         if action_str.lower().startswith("action:"):
             action_str = action_str[7:].strip()
-        actions.append(f"Action: {action_str}")
-    return actions if actions else [f"Action: {response.strip()}"]
+        actions.append(action_str)
+    return actions if actions else [response.strip()]
 
 
 def _extract_call_parts(action_str: str) -> tuple[str, str]:
     raw = action_str.strip()
     if raw.lower().startswith("action:"):
         raw = raw[7:].strip()
-    match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*)\((.*)\)$", raw, re.DOTALL)
+    match = _CALL_SIG_RE.match(raw)
     if not match:
         return raw.lower(), ""
     return match.group(1).lower(), match.group(2).strip()
 
 
-def _extract_quoted_arg(args: str, name: str) -> str | None:
-    pattern = re.compile(rf"{name}\s*=\s*'([^']*)'")
-    match = pattern.search(args)
-    if match:
-        return match.group(1)
-    pattern = re.compile(rf'{name}\s*=\s*"([^"]*)"')
-    match = pattern.search(args)
-    if match:
-        return match.group(1)
-    return None
+def _parse_call_args(args: str) -> dict[str, str]:
+    """Single-pass scan of ``name='value'`` pairs (either quote style)."""
+    parsed: dict[str, str] = {}
+    i = 0
+    n = len(args)
+    while i < n:
+        ch = args[i]
+        if not (ch.isalpha() or ch == "_"):
+            i += 1
+            continue
+        start = i
+        while i < n and (args[i].isalnum() or args[i] == "_"):
+            i += 1
+        name = args[start:i]
+        while i < n and args[i].isspace():
+            i += 1
+        if i >= n or args[i] != "=":
+            continue
+        i += 1
+        while i < n and args[i].isspace():
+            i += 1
+        if i >= n or args[i] not in "'\"":
+            continue
+        quote = args[i]
+        i += 1
+        value_start = i
+        while i < n and args[i] != quote:
+            i += 1
+        if i >= n:
+            break
+        parsed.setdefault(name, args[value_start:i])
+        i += 1
+    return parsed
 
 
 def _looks_like_app_launch_instruction(instruction: str) -> bool:
@@ -1070,7 +1241,7 @@ def _powershell_start_process_command(file_path: str, expand_env: bool = False)
 
 
 def _build_direct_launch_commands(app_name: str) -> list[tuple[str, list[str]]]:
-    system = platform.system().lower()
+    system = _SYSTEM.lower()
     candidates = _app_name_candidates(app_name)
     commands: list[tuple[str, list[str]]] = []
 
@@ -1181,12 +1352,11 @@ def _instruction_allows_window_management_hotkeys(instruction: str) -> bool:
     return bool(re.search(r"(关闭|退出|最小化|隐藏|收起|关掉)", text))
 
 
-def _extract_point_arg(args: str, name: str) -> list[float] | None:
-    value = _extract_quoted_arg(args, name)
+def _parse_point_value(value: str | None) -> list[float] | None:
     if not value:
         return None
     cleaned = value.replace("<point>", "").replace("</point>", "").strip()
-    parts = re.split(r"\s+", cleaned)
+    parts = _WS_RE.split(cleaned)
     if len(parts) < 2:
         return None
     try:
@@ -1197,38 +1367,39 @@ def _extract_point_arg(args: str, name: str) -> list[float] | None:
 
 def _parse_builtin_action(action_str: str) -> dict[str, Any] | None:
     action_type, args = _extract_call_parts(action_str)
+    parsed_args = _parse_call_args(args)
     if action_type in {"click", "left_single", "left_double", "right_single", "hover"}:
-        point = _extract_point_arg(args, "point") or _extract_point_arg(args, "start_point")
+        point = _parse_point_value(parsed_args.get("point") or parsed_args.get("start_point"))
         if not point:
             return None
         return {"action_type": action_type, "action_inputs": {"start_box": point}}
     if action_type in {"drag", "select"}:
-        start = _extract_point_arg(args, "start_point")
-        end = _extract_point_arg(args, "end_point")
+        start = _parse_point_value(parsed_args.get("start_point"))
+        end = _parse_point_value(parsed_args.get("end_point"))
         if not start or not end:
             return None
         return {"action_type": action_type, "action_inputs": {"start_box": start, "end_box": end}}
     if action_type == "scroll":
-        direction = _extract_quoted_arg(args, "direction") or "down"
-        point = _extract_point_arg(args, "point")
+        direction = parsed_args.get("direction") or "down"
+        point = _parse_point_value(parsed_args.get("point"))
         inputs: dict[str, Any] = {"direction": direction}
         if point:
             inputs["start_box"] = point
         return {"action_type": action_type, "action_inputs": inputs}
     if action_type == "type":
-        content = _extract_quoted_arg(args, "content")
+        content = parsed_args.get("content")
         if content is None:
             return None
         return {"action_type": action_type, "action_inputs": {"content": content}}
     if action_type == "hotkey":
-        key_combo = _extract_quoted_arg(args, "key") or _extract_quoted_arg(args, "content")
+        key_combo = parsed_args.get("key") or parsed_args.get("content")
         if key_combo is None:
             return None
         return {"action_type": action_type, "action_inputs": {"key": key_combo}}
     if action_type == "wait":
         return {"action_type": action_type, "action_inputs": {}}
     if action_type == "finished":
-        content = _extract_quoted_arg(args, "content")
+        content = parsed_args.get("content")
         inputs = {"content": content} if content else {}
         return {"action_type": action_type, "action_inputs": inputs}
     return None
@@ -1575,7 +1746,7 @@ def auto_image_understanding(
         )
 
 
-def auto_screen_operation(
+async def auto_screen_operation_async(
     instruction: str,
     api_key: str,
     model_name: str | None = None,
@@ -1590,7 +1761,7 @@ def auto_screen_operation(
     timing: dict[str, float] = {}
     total_start = time.perf_counter()
     try:
-        deps = _import_gui_dependencies()
+        deps = _import_gui_dependencies(execute_action=execute_action)
         tuning = resolve_performance_tuning(performance_profile)
         max_steps = max(1, int(max_steps))
         wechat_send_request = _extract_wechat_send_request(instruction) if execute_action else None
@@ -1647,12 +1818,16 @@ def auto_screen_operation(
 
         for step_index in range(1, max_steps + 1):
             step = time.perf_counter()
-            _, img_width, img_height, base64_image, capture_region = capture_screenshot(
-                deps,
-                quality=tuning.screenshot_quality,
-                max_long_edge=tuning.screenshot_max_long_edge,
-                capture_mode=capture_mode,
-                app_launch_intent=needs_launch_context,
+            _, img_width, img_height, base64_image, capture_region = await asyncio.get_running_loop().run_in_executor(
+                _get_capture_executor(),
+                functools.partial(
+                    capture_screenshot,
+                    deps,
+                    quality=tuning.screenshot_quality,
+                    max_long_edge=tuning.screenshot_max_long_edge,
+                    capture_mode=capture_mode,
+                    app_launch_intent=needs_launch_context,
+                ),
             )
             _record_timing("screenshot_ms", (time.perf_counter() - step) * 1000, step_index)
 
@@ -1668,7 +1843,7 @@ def auto_screen_operation(
             _record_timing("build_conv_ms", (time.perf_counter() - step) * 1000, step_index)
 
             step = time.perf_counter()
-            response = call_model_inference(
+            response = await call_model_inference_async(
                 deps,
                 messages,
                 api_key=api_key,
@@ -1721,12 +1896,16 @@ def auto_screen_operation(
             # For app launch intents: if shortcut execution failed, retry once with GUI fallback guidance.
             if app_launch_intent and _has_hotkey_failure(step_result):
                 step = time.perf_counter()
-                _, fb_img_width, fb_img_height, fb_base64_image, fb_capture_region = capture_screenshot(
-                    deps,
-                    quality=tuning.screenshot_quality,
-                    max_long_edge=tuning.screenshot_max_long_edge,
-                    capture_mode=capture_mode,
-                    app_launch_intent=needs_launch_context,
+                _, fb_img_width, fb_img_height, fb_base64_image, fb_capture_region = await asyncio.get_running_loop().run_in_executor(
+                    _get_capture_executor(),
+                    functools.partial(
+                        capture_screenshot,
+                        deps,
+                        quality=tuning.screenshot_quality,
+                        max_long_edge=tuning.screenshot_max_long_edge,
+                        capture_mode=capture_mode,
+                        app_launch_intent=needs_launch_context,
+                    ),
                 )
                 timing["fallback_screenshot_ms"] = timing.get("fallback_screenshot_ms", 0.0) + (
                     (time.perf_counter() - step) * 1000
@@ -1746,7 +1925,7 @@ def auto_screen_operation(
                 )
 
                 step = time.perf_counter()
-                fallback_response = call_model_inference(
+                fallback_response = await call_model_inference_async(
                     deps,
                     fallback_messages,
                     api_key=api_key,
@@ -1815,3 +1994,40 @@ def auto_screen_operation(
             timing=timing,
             error=str(exc),
         )
+
+
+def auto_screen_operation(
+    instruction: str,
+    api_key: str,
+    model_name: str | None = None,
+    base_url: str | None = None,
+    action_parser: str = "builtin",
+    action_parser_callable: str | None = None,
+    execute_action: bool = True,
+    performance_profile: str = DEFAULT_PERFORMANCE_PROFILE,
+    capture_mode: str = DEFAULT_CAPTURE_MODE,
+    max_steps: int = 1,
+) -> AutomationResult:
+    async def _run_and_cleanup() -> AutomationResult:
+        try:
+            return await auto_screen_operation_async(
+                instruction=instruction,
+                api_key=api_key,
+                model_name=model_name,
+                base_url=base_url,
+                action_parser=action_parser,
+                action_parser_callable=action_parser_callable,
+                execute_action=execute_action,
+                performance_profile=performance_profile,
+                capture_mode=capture_mode,
+                max_steps=max_steps,
+            )
+        finally:
+            # Async clients are bound to this event loop; drop them before it closes.
+            clients = list(_async_httpx_clients.values())
+            _async_httpx_clients.clear()
+            for client in clients:
+                with contextlib.suppress(Exception):
+                    await client.aclose()
+
+    return asyncio.run(_run_and_cleanup())
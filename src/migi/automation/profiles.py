@@ -0,0 +1,92 @@
+"""Performance profiles and capture-mode choices, import-light for the CLI."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+DEFAULT_PERFORMANCE_PROFILE = "balanced"
+DEFAULT_CAPTURE_MODE = "auto"
+
+CAPTURE_MODE_CHOICES = ("auto", "screen", "window")
+
+
+@dataclass(frozen=True)
+class PerformanceTuning:
+    name: str
+    screenshot_quality: int
+    screenshot_max_long_edge: int
+    request_timeout_seconds: float
+    computer_use_max_tokens: int | None
+    image_max_tokens: int | None
+    action_inter_step_delay: float
+    action_clipboard_sync_delay: float
+    action_paste_settle_delay: float
+    action_pre_exec_delay: float
+    action_hotkey_interval: float
+    action_wait_duration: float
+
+
+PERFORMANCE_PROFILES: dict[str, PerformanceTuning] = {
+    "fast": PerformanceTuning(
+        name="fast",
+        screenshot_quality=60,
+        screenshot_max_long_edge=1366,
+        request_timeout_seconds=60.0,
+        computer_use_max_tokens=192,
+        image_max_tokens=384,
+        action_inter_step_delay=0.04,
+        action_clipboard_sync_delay=0.03,
+        action_paste_settle_delay=0.06,
+        action_pre_exec_delay=0.04,
+        action_hotkey_interval=0.03,
+        action_wait_duration=1.0,
+    ),
+    "balanced": PerformanceTuning(
+        name="balanced",
+        screenshot_quality=70,
+        screenshot_max_long_edge=1600,
+        request_timeout_seconds=90.0,
+        computer_use_max_tokens=256,
+        image_max_tokens=512,
+        action_inter_step_delay=0.08,
+        action_clipboard_sync_delay=0.05,
+        action_paste_settle_delay=0.12,
+        action_pre_exec_delay=0.08,
+        action_hotkey_interval=0.05,
+        action_wait_duration=2.0,
+    ),
+    "accurate": PerformanceTuning(
+        name="accurate",
+        screenshot_quality=80,
+        screenshot_max_long_edge=1920,
+        request_timeout_seconds=120.0,
+        computer_use_max_tokens=384,
+        image_max_tokens=768,
+        action_inter_step_delay=0.08,
+        action_clipboard_sync_delay=0.05,
+        action_paste_settle_delay=0.12,
+        action_pre_exec_delay=0.08,
+        action_hotkey_interval=0.05,
+        action_wait_duration=2.0,
+    ),
+}
+
+
+def resolve_performance_tuning(profile: str | None = None) -> PerformanceTuning:
+    profile_name = (profile or DEFAULT_PERFORMANCE_PROFILE).strip().lower()
+    tuning = PERFORMANCE_PROFILES.get(profile_name)
+    if tuning is None:
+        supported = ", ".join(sorted(PERFORMANCE_PROFILES))
+        raise ValueError(f"Unsupported performance profile: {profile_name}. Use one of: {supported}.")
+    return tuning
+
+
+def resolve_capture_mode(capture_mode: str | None = None, app_launch_intent: bool = False) -> str:
+    mode = (capture_mode or DEFAULT_CAPTURE_MODE).strip().lower()
+    if mode not in CAPTURE_MODE_CHOICES:
+        supported = ", ".join(CAPTURE_MODE_CHOICES)
+        raise ValueError(f"Unsupported capture mode: {mode}. Use one of: {supported}.")
+    if mode == "auto":
+        return "screen" if app_launch_intent else "window"
+    return mode
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import functools
 import importlib.util
 import sys
 from pathlib import Path
-from typing import Any
 
 from migi import __version__
-from migi.automation.engine import (
+from migi.automation.profiles import (
     CAPTURE_MODE_CHOICES,
     DEFAULT_PERFORMANCE_PROFILE,
     DEFAULT_CAPTURE_MODE,
     PERFORMANCE_PROFILES,
-    auto_image_understanding,
-    auto_screen_operation,
 )
 from migi.config import (
     MigiConfig,
@@ -23,8 +22,8 @@ from migi.config import (
     resolve_runtime_config,
     save_file_config,
 )
-from migi.installers import KNOWN_TARGETS, install_many, resolve_targets
-from migi.json_result import ResultBuilder, emit_json
+from migi.installers import KNOWN_TARGETS
+from migi.json_result import CommandResult, ResultBuilder, emit_json
 
 
 class JsonArgumentParser(argparse.ArgumentParser):
@@ -34,36 +33,65 @@ class JsonArgumentParser(argparse.ArgumentParser):
 
 PERFORMANCE_CHOICES = tuple(PERFORMANCE_PROFILES.keys())
 
+_COMMAND_NAMES = frozenset(
+    {"setup", "init", "status", "config", "see", "act", "image", "vision", "install", "install-skill"}
+)
+_SETUP_ALIASES = frozenset({"setup", "init"})
+_INSTALL_ALIASES = frozenset({"install", "install-skill"})
+_IMAGE_ALIASES = frozenset({"image", "vision"})
+_RUN_COMMANDS = frozenset({"see", "act"})
+_ACTION_PARSERS = frozenset({"doubao", "custom"})
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    for token in argv:
+        if token == "--":
+            break
+        if not token.startswith("-") and token in _COMMAND_NAMES:
+            return token
+    return None
+
+
+def _build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    # Each run dispatches exactly one command; when `only` names it, skip
+    # constructing every other subparser. `only=None` builds the full tree
+    # (the --help path and unknown-command errors).
+    def _want(*names: str) -> bool:
+        return only is None or only in names
 
-def _build_parser() -> argparse.ArgumentParser:
     parser = JsonArgumentParser(prog="migi", description="Task-oriented GUI automation CLI.")
     parser.add_argument("--version", action="version", version=f"migi {__version__}")
     parser.add_argument("--json", dest="json_mode", choices=["compact", "full"])
     subparsers = parser.add_subparsers(dest="command")
 
-    setup_p = subparsers.add_parser("setup", aliases=["init"], help="Initialize model config.")
-    setup_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    setup_p.add_argument("--api-key", dest="api_key")
-    setup_p.add_argument("--model")
-    setup_p.add_argument("--base-url", dest="base_url")
-    setup_p.add_argument("--provider", default="openai-compatible")
-    setup_p.add_argument("--action-parser", choices=["doubao", "custom"])
-    setup_p.add_argument("--action-parser-callable", dest="action_parser_callable")
-    setup_p.add_argument("--config-path", dest="config_path")
-    setup_p.add_argument("--non-interactive", action="store_true")
-
-    status_p = subparsers.add_parser("status", help="Show effective config status.")
-    status_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    status_p.add_argument("--config-path", dest="config_path")
-
-    config_p = subparsers.add_parser("config", help="Config helper commands.")
-    config_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    config_sub = config_p.add_subparsers(dest="config_command")
-    config_show = config_sub.add_parser("show", help="Alias for status.")
-    config_show.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    config_show.add_argument("--config-path", dest="config_path")
+    if _want("setup", "init"):
+        setup_p = subparsers.add_parser("setup", aliases=["init"], help="Initialize model config.")
+        setup_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        setup_p.add_argument("--api-key", dest="api_key")
+        setup_p.add_argument("--model")
+        setup_p.add_argument("--base-url", dest="base_url")
+        setup_p.add_argument("--provider", default="openai-compatible")
+        setup_p.add_argument("--action-parser", choices=["doubao", "custom"])
+        setup_p.add_argument("--action-parser-callable", dest="action_parser_callable")
+        setup_p.add_argument("--config-path", dest="config_path")
+        setup_p.add_argument("--non-interactive", action="store_true")
+
+    if _want("status"):
+        status_p = subparsers.add_parser("status", help="Show effective config status.")
+        status_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        status_p.add_argument("--config-path", dest="config_path")
+
+    if _want("config"):
+        config_p = subparsers.add_parser("config", help="Config helper commands.")
+        config_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        config_sub = config_p.add_subparsers(dest="config_command")
+        config_show = config_sub.add_parser("show", help="Alias for status.")
+        config_show.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        config_show.add_argument("--config-path", dest="config_path")
 
     for cmd_name, help_text in [("see", "Analyze current screen only."), ("act", "Analyze and execute actions.")]:
+        if not _want(cmd_name):
+            continue
         run_p = subparsers.add_parser(cmd_name, help=help_text)
         run_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
         run_p.add_argument("instruction", help="Natural language GUI instruction.")
@@ -94,42 +122,44 @@ def _build_parser() -> argparse.ArgumentParser:
         run_p.add_argument("--config-path", dest="config_path")
         run_p.add_argument("--no-exec", action="store_true", help="Disable action execution.")
 
-    image_p = subparsers.add_parser("image", aliases=["vision"], help="Analyze a local image file.")
-    image_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    image_p.add_argument("image_path", help="Path to local image file.")
-    image_p.add_argument(
-        "instruction",
-        nargs="?",
-        default="Describe this image in detail.",
-        help="Instruction or question about the image.",
-    )
-    image_p.add_argument("--api-key", dest="api_key")
-    image_p.add_argument("--model")
-    image_p.add_argument("--base-url", dest="base_url")
-    image_p.add_argument("--provider")
-    image_p.add_argument(
-        "--performance",
-        choices=PERFORMANCE_CHOICES,
-        default=DEFAULT_PERFORMANCE_PROFILE,
-        help="Latency/accuracy profile for image upload and model calls.",
-    )
-    image_p.add_argument("--config-path", dest="config_path")
+    if _want("image", "vision"):
+        image_p = subparsers.add_parser("image", aliases=["vision"], help="Analyze a local image file.")
+        image_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        image_p.add_argument("image_path", help="Path to local image file.")
+        image_p.add_argument(
+            "instruction",
+            nargs="?",
+            default="Describe this image in detail.",
+            help="Instruction or question about the image.",
+        )
+        image_p.add_argument("--api-key", dest="api_key")
+        image_p.add_argument("--model")
+        image_p.add_argument("--base-url", dest="base_url")
+        image_p.add_argument("--provider")
+        image_p.add_argument(
+            "--performance",
+            choices=PERFORMANCE_CHOICES,
+            default=DEFAULT_PERFORMANCE_PROFILE,
+            help="Latency/accuracy profile for image upload and model calls.",
+        )
+        image_p.add_argument("--config-path", dest="config_path")
 
-    install_p = subparsers.add_parser("install", aliases=["install-skill"], help="Install skill package.")
-    install_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
-    install_p.add_argument("--target", choices=["all", *KNOWN_TARGETS], default="all")
-    install_p.add_argument("--path", dest="custom_path")
-    install_p.add_argument("--dry-run", action="store_true")
+    if _want("install", "install-skill"):
+        install_p = subparsers.add_parser("install", aliases=["install-skill"], help="Install skill package.")
+        install_p.add_argument("--json", dest="json_mode", choices=["compact", "full"])
+        install_p.add_argument("--target", choices=["all", *KNOWN_TARGETS], default="all")
+        install_p.add_argument("--path", dest="custom_path")
+        install_p.add_argument("--dry-run", action="store_true")
 
     return parser
 
 
 def _canonical_command(args: argparse.Namespace) -> str:
-    if args.command in {"init", "setup"}:
+    if args.command in _SETUP_ALIASES:
         return "setup"
-    if args.command in {"install", "install-skill"}:
+    if args.command in _INSTALL_ALIASES:
         return "install"
-    if args.command in {"image", "vision"}:
+    if args.command in _IMAGE_ALIASES:
         return "image"
     if args.command == "config" and getattr(args, "config_command", None) == "show":
         return "status"
@@ -141,7 +171,7 @@ def _prompt_value(prompt: str) -> str | None:
     return value or None
 
 
-def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
+def _handle_setup(args: argparse.Namespace) -> CommandResult:
     builder = ResultBuilder.start("setup")
     explicit_path = Path(args.config_path).expanduser() if args.config_path else None
     path = explicit_path or default_config_path()
@@ -152,7 +182,6 @@ def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
     provider = args.provider
     action_parser = args.action_parser
     action_parser_callable = args.action_parser_callable
-    updated_fields: list[str] = []
 
     if not args.non_interactive and sys.stdin.isatty():
         if api_key is None:
@@ -163,7 +192,7 @@ def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
             base_url = _prompt_value("base_url (leave blank to keep current): ")
     if action_parser is not None:
         action_parser = action_parser.strip().lower()
-        if action_parser not in {"doubao", "custom"}:
+        if action_parser not in _ACTION_PARSERS:
             return builder.fail(
                 code="CONFIG_INVALID",
                 message="Invalid action parser backend.",
@@ -172,7 +201,7 @@ def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
                 hint="Use one of: doubao, custom.",
             )
 
-    current = load_file_config(path=resolve_config_path(path))
+    current = load_file_config(path=explicit_path)
     next_cfg = MigiConfig(
         provider=provider or current.provider,
         api_key=api_key if api_key is not None else current.api_key,
@@ -185,18 +214,11 @@ def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
             else current.action_parser_callable
         ),
     )
-    if current.provider != next_cfg.provider:
-        updated_fields.append("provider")
-    if current.api_key != next_cfg.api_key:
-        updated_fields.append("api_key")
-    if current.model != next_cfg.model:
-        updated_fields.append("model")
-    if current.base_url != next_cfg.base_url:
-        updated_fields.append("base_url")
-    if current.action_parser != next_cfg.action_parser:
-        updated_fields.append("action_parser")
-    if current.action_parser_callable != next_cfg.action_parser_callable:
-        updated_fields.append("action_parser_callable")
+    updated_fields = [
+        field.name
+        for field in dataclasses.fields(MigiConfig)
+        if getattr(current, field.name) != getattr(next_cfg, field.name)
+    ]
 
     if next_cfg.action_parser == "custom" and not next_cfg.action_parser_callable:
         return builder.fail(
@@ -234,19 +256,24 @@ def _handle_setup(args: argparse.Namespace) -> dict[str, Any]:
     )
 
 
+_REPORTED_DEPENDENCIES = (
+    "mss",
+    "pyautogui",
+    "pyperclip",
+    "PIL",
+    "ui_tars",
+    "httpx",
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _dependency_report() -> dict[str, bool]:
-    deps = [
-        "mss",
-        "pyautogui",
-        "pyperclip",
-        "PIL",
-        "ui_tars",
-        "httpx",
-    ]
-    return {name: importlib.util.find_spec(name) is not None for name in deps}
+    # find_spec walks sys.path per probe; the answer cannot change within
+    # one process, so compute it once.
+    return {name: importlib.util.find_spec(name) is not None for name in _REPORTED_DEPENDENCIES}
 
 
-def _handle_status(args: argparse.Namespace) -> dict[str, Any]:
+def _handle_status(args: argparse.Namespace) -> CommandResult:
     builder = ResultBuilder.start("status")
     path = Path(args.config_path).expanduser() if args.config_path else resolve_config_path()
     effective, sources = resolve_runtime_config(path=path)
@@ -273,7 +300,7 @@ def _handle_status(args: argparse.Namespace) -> dict[str, Any]:
     )
 
 
-def _handle_see_or_act(args: argparse.Namespace, command: str) -> dict[str, Any]:
+def _handle_see_or_act(args: argparse.Namespace, command: str) -> CommandResult:
     builder = ResultBuilder.start(command)
     cfg_path = Path(args.config_path).expanduser() if args.config_path else resolve_config_path()
     effective, sources = resolve_runtime_config(
@@ -304,6 +331,10 @@ def _handle_see_or_act(args: argparse.Namespace, command: str) -> dict[str, Any]
             data={"sources": sources},
         )
 
+    # Deferred: pulling in the automation engine for every subcommand would
+    # slow down setup/status/install and --help.
+    from migi.automation.engine import auto_screen_operation
+
     execute_action = False if command == "see" else (not args.no_exec)
     result = auto_screen_operation(
         instruction=args.instruction,
@@ -359,7 +390,7 @@ def _handle_see_or_act(args: argparse.Namespace, command: str) -> dict[str, Any]
     )
 
 
-def _handle_image(args: argparse.Namespace) -> dict[str, Any]:
+def _handle_image(args: argparse.Namespace) -> CommandResult:
     builder = ResultBuilder.start("image")
     cfg_path = Path(args.config_path).expanduser() if args.config_path else resolve_config_path()
     effective, sources = resolve_runtime_config(
@@ -379,6 +410,8 @@ def _handle_image(args: argparse.Namespace) -> dict[str, Any]:
             data={"sources": sources},
         )
 
+    from migi.automation.engine import auto_image_understanding
+
     image_path = Path(args.image_path).expanduser()
     result = auto_image_understanding(
         instruction=args.instruction,
@@ -421,7 +454,9 @@ def _handle_image(args: argparse.Namespace) -> dict[str, Any]:
     )
 
 
-def _handle_install(args: argparse.Namespace) -> dict[str, Any]:
+def _handle_install(args: argparse.Namespace) -> CommandResult:
+    from migi.installers import install_many, resolve_targets
+
     builder = ResultBuilder.start("install")
     if args.custom_path and args.target != "all":
         targets = resolve_targets(args.target, args.custom_path)
@@ -444,13 +479,13 @@ def _handle_install(args: argparse.Namespace) -> dict[str, Any]:
     )
 
 
-def _dispatch(args: argparse.Namespace) -> dict[str, Any]:
+def _dispatch(args: argparse.Namespace) -> CommandResult:
     command = _canonical_command(args)
     if command == "setup":
         return _handle_setup(args)
     if command == "status":
         return _handle_status(args)
-    if command in {"see", "act"}:
+    if command in _RUN_COMMANDS:
         return _handle_see_or_act(args, command)
     if command == "image":
         return _handle_image(args)
@@ -466,29 +501,57 @@ def _dispatch(args: argparse.Namespace) -> dict[str, Any]:
     )
 
 
+_VALID_JSON_MODES = frozenset({"compact", "full"})
+
+
 def _extract_json_mode(argv: list[str]) -> str:
-    mode = "compact"
     for index, token in enumerate(argv):
+        if token == "--":
+            # argparse separator: everything after is positional data.
+            break
         if token.startswith("--json="):
-            _, value = token.split("=", 1)
-            if value in {"compact", "full"}:
-                mode = value
+            value = token[7:]
         elif token == "--json" and index + 1 < len(argv):
             value = argv[index + 1]
-            if value in {"compact", "full"}:
-                mode = value
-    return mode
+        else:
+            continue
+        if value in _VALID_JSON_MODES:
+            return value
+    return "compact"
+
+
+def _handle_top_level_flag(raw_argv: list[str]) -> int:
+    # Leading --version/--help need no subparser tree; answer them before
+    # paying for argparse construction and help rendering.
+    if raw_argv[0] == "--version":
+        sys.stdout.write(f"migi {__version__}\n")
+        return 0
+    if any(token == "--json" or token.startswith("--json=") for token in raw_argv[1:]):
+        payload = ResultBuilder.start("help").ok(
+            code="HELP",
+            message="Available commands.",
+            data={"commands": sorted(_COMMAND_NAMES)},
+        )
+        emit_json(payload, mode=_extract_json_mode(raw_argv))
+        return 0
+    _build_parser().print_help()
+    return 0
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
     raw_argv = argv if argv is not None else sys.argv[1:]
+    if raw_argv and raw_argv[0] in ("--version", "--help", "-h"):
+        return _handle_top_level_flag(raw_argv)
+    if "--help" in raw_argv or "-h" in raw_argv:
+        parser = _build_parser()
+    else:
+        parser = _build_parser(_sniff_subcommand(raw_argv))
     json_mode = _extract_json_mode(raw_argv)
     try:
         args = parser.parse_args(raw_argv)
         payload = _dispatch(args)
         emit_json(payload, mode=json_mode)
-        return 0 if payload.get("ok") else 2
+        return 0 if payload.ok else 2
     except Exception as exc:  # noqa: BLE001
         payload = ResultBuilder.start("unknown").fail(
             code="UNHANDLED_ERROR",
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any
 
 
+@functools.lru_cache(maxsize=1)
 def default_config_path() -> Path:
+    # Home cannot change mid-process; build the default path once instead of
+    # re-reading HOME in every handler that resolves the config location.
     return Path.home() / ".migi" / "config.json"
 
 
@@ -45,11 +49,10 @@ def _mask_secret(value: str) -> str:
     return f"{value[:3]}***{value[-3:]}"
 
 
-def load_file_config(path: Path | None = None) -> MigiConfig:
-    path = resolve_config_path(path=path)
-    if not path.exists():
-        return MigiConfig()
-    raw = json.loads(path.read_text(encoding="utf-8"))
+@functools.lru_cache(maxsize=8)
+def _load_file_config_cached(path_str: str, mtime_ns: int) -> MigiConfig:
+    # mtime_ns keys the cache entry so an edited file is re-parsed.
+    raw = json.loads(Path(path_str).read_text(encoding="utf-8"))
     return MigiConfig(
         provider=raw.get("provider", "openai-compatible"),
         api_key=raw.get("api_key"),
@@ -60,10 +63,20 @@ def load_file_config(path: Path | None = None) -> MigiConfig:
     )
 
 
+def load_file_config(path: Path | None = None) -> MigiConfig:
+    path = resolve_config_path(path=path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return MigiConfig()
+    return _load_file_config_cached(str(path), stat.st_mtime_ns)
+
+
 def save_file_config(config: MigiConfig, path: Path | None = None) -> Path:
     path = path or default_config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(asdict(config), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    _load_file_config_cached.cache_clear()
     return path
 
 
@@ -77,32 +90,28 @@ def resolve_runtime_config(
     path: Path | None = None,
 ) -> tuple[MigiConfig, dict[str, str]]:
     file_cfg = load_file_config(path=path)
-    sources: dict[str, str] = {}
 
-    provider = cli_provider or file_cfg.provider or "openai-compatible"
-    sources["provider"] = "cli" if cli_provider else ("config" if file_cfg.provider else "default")
-
-    api_key = cli_api_key or file_cfg.api_key
-    sources["api_key"] = "cli" if cli_api_key else ("config" if file_cfg.api_key else "unset")
-
-    model = cli_model or file_cfg.model
-    sources["model"] = "cli" if cli_model else ("config" if file_cfg.model else "unset")
-
-    base_url = cli_base_url or file_cfg.base_url
-    sources["base_url"] = "cli" if cli_base_url else ("config" if file_cfg.base_url else "unset")
-
-    action_parser = cli_action_parser or file_cfg.action_parser or "doubao"
-    sources["action_parser"] = "cli" if cli_action_parser else ("config" if file_cfg.action_parser else "default")
-
-    action_parser_callable = cli_action_parser_callable or file_cfg.action_parser_callable
-    sources["action_parser_callable"] = "cli" if cli_action_parser_callable else ("config" if file_cfg.action_parser_callable else "unset")
-
-    return MigiConfig(
-        provider=provider,
-        api_key=api_key,
-        model=model,
-        base_url=base_url,
-        action_parser=action_parser,
-        action_parser_callable=action_parser_callable,
-    ), sources
+    # One precedence rule (cli > config file > default) applied per field;
+    # fields with a None default report "unset" when nothing provides them.
+    fields = (
+        ("provider", cli_provider, "openai-compatible"),
+        ("api_key", cli_api_key, None),
+        ("model", cli_model, None),
+        ("base_url", cli_base_url, None),
+        ("action_parser", cli_action_parser, "doubao"),
+        ("action_parser_callable", cli_action_parser_callable, None),
+    )
+    resolved: dict[str, Any] = {}
+    sources: dict[str, str] = {}
+    for name, cli_value, default in fields:
+        file_value = getattr(file_cfg, name)
+        resolved[name] = cli_value or file_value or default
+        if cli_value:
+            sources[name] = "cli"
+        elif file_value:
+            sources[name] = "config"
+        else:
+            sources[name] = "default" if default is not None else "unset"
+
+    return MigiConfig(**resolved), sources
 
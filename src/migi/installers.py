@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+import os
 import shutil
+import stat
 from typing import Iterable
 
 
@@ -11,56 +13,60 @@ SKILL_NAME = "migi"
 SKILL_ASSET_DIR = "migi-desktop"
 
 
-def _home(path: str) -> Path:
-    return Path(path).expanduser()
+_HOME = Path.home()
+
+# Candidate roots do not depend on runtime state, so build the table once
+# instead of on every candidate_roots call.
+_CANDIDATE_ROOTS: dict[str, list[Path]] = {
+    "cursor": [
+        _HOME / ".cursor",
+        _HOME / "Library/Application Support/Cursor/User",
+        _HOME / ".config/Cursor",
+    ],
+    "claude-code": [
+        _HOME / ".claude",
+        _HOME / ".config/claude-code",
+    ],
+    "open-code": [
+        _HOME / ".opencode",
+        _HOME / ".config/opencode",
+    ],
+    "neostream": [
+        _HOME / ".neostream",
+        _HOME / ".config/neostream",
+    ],
+    "lingxibox": [
+        _HOME / ".lingxibox",
+        _HOME / ".config/lingxibox",
+        _HOME / "codes/lingxibox-1",
+    ],
+}
 
 
 def candidate_roots(target: str) -> list[Path]:
-    mapping: dict[str, list[Path]] = {
-        "cursor": [
-            _home("~/.cursor"),
-            _home("~/Library/Application Support/Cursor/User"),
-            _home("~/.config/Cursor"),
-        ],
-        "claude-code": [
-            _home("~/.claude"),
-            _home("~/.config/claude-code"),
-        ],
-        "open-code": [
-            _home("~/.opencode"),
-            _home("~/.config/opencode"),
-        ],
-        "neostream": [
-            _home("~/.neostream"),
-            _home("~/.config/neostream"),
-        ],
-        "lingxibox": [
-            _home("~/.lingxibox"),
-            _home("~/.config/lingxibox"),
-            _home("~/codes/lingxibox-1"),
-        ],
-    }
-    return mapping.get(target, [])
+    return _CANDIDATE_ROOTS.get(target, [])
+
+
+def _skills_dir(root: Path) -> Path:
+    return root if root.name == "skills" else root / "skills"
 
 
 def resolve_target_dir(target: str) -> Path:
-    for root in candidate_roots(target):
-        if root.exists():
-            if root.name == "skills":
-                return root
-            return root / "skills"
     roots = candidate_roots(target)
-    if roots:
-        base = roots[0]
-        if base.name == "skills":
-            return base
-        return base / "skills"
-    raise ValueError(f"Unknown target: {target}")
+    if not roots:
+        raise ValueError(f"Unknown target: {target}")
+    for root in roots:
+        if root.exists():
+            return _skills_dir(root)
+    return _skills_dir(roots[0])
+
+
+_SKILL_ASSET_PATH = Path(__file__).resolve().parent / "assets" / SKILL_ASSET_DIR
 
 
 def skill_asset_dir() -> Path:
     # Keep source asset folder stable while exposing a cleaner installed skill name.
-    return Path(__file__).resolve().parent / "assets" / SKILL_ASSET_DIR
+    return _SKILL_ASSET_PATH
 
 
 @dataclass
@@ -79,22 +85,27 @@ class InstallItemResult:
         }
 
 
+def _remove_existing(dest: Path) -> None:
+    # A single lstat distinguishes symlink/dir/file; the previous
+    # exists/is_symlink/is_dir probes each cost their own syscall.
+    try:
+        st = os.lstat(dest)
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(st.st_mode):
+        shutil.rmtree(dest)
+    else:
+        dest.unlink()
+
+
 def _copy_tree(src: Path, dest: Path) -> None:
-    if dest.exists():
-        if dest.is_symlink() or dest.is_file():
-            dest.unlink()
-        else:
-            shutil.rmtree(dest)
+    _remove_existing(dest)
     shutil.copytree(src, dest)
 
 
 def _symlink_or_copy(src: Path, dest: Path) -> tuple[str, str | None]:
     try:
-        if dest.exists() or dest.is_symlink():
-            if dest.is_dir() and not dest.is_symlink():
-                shutil.rmtree(dest)
-            else:
-                dest.unlink()
+        _remove_existing(dest)
         dest.symlink_to(src, target_is_directory=True)
         return "installed", "symlink"
     except OSError:
@@ -107,10 +118,11 @@ def install_skill_to_path(
     skills_dir: Path,
     dry_run: bool = False,
 ) -> InstallItemResult:
-    src = skill_asset_dir()
     dest = skills_dir / SKILL_NAME
     if dry_run:
+        # Dry runs only report the destination; don't resolve the asset dir.
         return InstallItemResult(name=target_name, path=str(dest), status="planned", reason="dry-run")
+    src = skill_asset_dir()
     skills_dir.mkdir(parents=True, exist_ok=True)
     status, reason = _symlink_or_copy(src, dest)
     return InstallItemResult(name=target_name, path=str(dest), status=status, reason=reason)
@@ -3,40 +3,96 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
+import sys
 import time
 from typing import Literal
 from typing import Any
 
-from migi import __version__
+_UTC = timezone.utc
 
+_version: str | None = None
 
-@dataclass
-class ResultBuilder:
+
+def _package_version() -> str:
+    # Imported lazily so building results never forces package metadata;
+    # only full-mode output (the one place meta appears) pays for it.
+    global _version
+    if _version is None:
+        from migi import __version__
+
+        _version = __version__
+    return _version
+
+try:  # Optional accelerator; stdlib json remains the fallback.
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+@dataclass(slots=True)
+class CommandResult:
+    ok: bool
     command: str
+    code: str
+    message: str
+    data: dict[str, Any]
+    error: dict[str, Any] | None
     started_at: float
 
-    @classmethod
-    def start(cls, command: str) -> "ResultBuilder":
-        return cls(command=command, started_at=time.perf_counter())
-
-    def _meta(self) -> dict[str, Any]:
-        return {
-            "duration_ms": round((time.perf_counter() - self.started_at) * 1000, 2),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "version": __version__,
+    def to_compact(self) -> dict[str, Any]:
+        compact: dict[str, Any] = {
+            "ok": self.ok,
+            "cmd": self.command,
+            "code": self.code,
         }
+        if self.ok:
+            compact["data"] = self.data
+        else:
+            compact["error"] = self.error
+            if self.data:
+                compact["data"] = self.data
+        return compact
 
-    def ok(self, code: str, message: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
+    def to_full(self) -> dict[str, Any]:
         return {
-            "ok": True,
+            "ok": self.ok,
             "command": self.command,
-            "code": code,
-            "message": message,
-            "data": data or {},
-            "error": None,
-            "meta": self._meta(),
+            "code": self.code,
+            "message": self.message,
+            "data": self.data,
+            "error": self.error,
+            "meta": {
+                "duration_ms": round((time.perf_counter() - self.started_at) * 1000, 2),
+                "timestamp": datetime.now(_UTC).isoformat(),
+                "version": _package_version(),
+            },
         }
 
+
+class ResultBuilder:
+    # Plain slotted class: this is a per-call namespace, not a value type,
+    # so the dataclass-generated __repr__/__eq__ machinery is dead weight.
+    __slots__ = ("command", "started_at")
+
+    def __init__(self, command: str, started_at: float) -> None:
+        self.command = command
+        self.started_at = started_at
+
+    @classmethod
+    def start(cls, command: str) -> "ResultBuilder":
+        return cls(command=command, started_at=time.perf_counter())
+
+    def ok(self, code: str, message: str, data: dict[str, Any] | None = None) -> CommandResult:
+        return CommandResult(
+            ok=True,
+            command=self.command,
+            code=code,
+            message=message,
+            data=data or {},
+            error=None,
+            started_at=self.started_at,
+        )
+
     def fail(
         self,
         code: str,
@@ -45,42 +101,35 @@ class ResultBuilder:
         detail: str,
         hint: str | None = None,
         data: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        return {
-            "ok": False,
-            "command": self.command,
-            "code": code,
-            "message": message,
-            "data": data or {},
-            "error": {
+    ) -> CommandResult:
+        return CommandResult(
+            ok=False,
+            command=self.command,
+            code=code,
+            message=message,
+            data=data or {},
+            error={
                 "type": error_type,
                 "detail": detail,
                 "hint": hint,
             },
-            "meta": self._meta(),
-        }
+            started_at=self.started_at,
+        )
 
 
-def _to_compact(payload: dict[str, Any]) -> dict[str, Any]:
-    compact: dict[str, Any] = {
-        "ok": bool(payload.get("ok")),
-        "cmd": payload.get("command"),
-        "code": payload.get("code"),
-    }
-    if compact["ok"]:
-        compact["data"] = payload.get("data", {})
+def emit_json(result: CommandResult, mode: Literal["compact", "full"] = "compact") -> None:
+    # Compact output never includes meta, so skip the full payload (and its
+    # datetime.now call) entirely on that path.
+    output = result.to_full() if mode == "full" else result.to_compact()
+    if _orjson is not None:
+        encoded = _orjson.dumps(output)
+    elif mode == "compact":
+        encoded = json.dumps(output, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     else:
-        compact["error"] = payload.get("error")
-        data = payload.get("data")
-        if data:
-            compact["data"] = data
-    return compact
-
-
-def emit_json(payload: dict[str, Any], mode: Literal["compact", "full"] = "compact") -> None:
-    if mode == "full":
-        output = payload
-    else:
-        output = _to_compact(payload)
-    print(json.dumps(output, ensure_ascii=False))
-
+        encoded = json.dumps(output, ensure_ascii=False).encode("utf-8")
+    # Write bytes straight to the underlying buffer; the TextIOWrapper adds
+    # encode + newline translation we don't need, and orjson is bytes already.
+    buffer = sys.stdout.buffer
+    buffer.write(encoded)
+    buffer.write(b"\n")
+    buffer.flush()